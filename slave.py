@@ -18,7 +18,8 @@ Repository Structure:
 Overview:
     1. Loads configuration from config.yaml.
     2. Checks the TASK_TYPE environment variable:
-         - If TASK_TYPE is "all", loads dependencies.yaml, computes the task execution order, and runs tasks sequentially.
+         - If TASK_TYPE is "all", loads dependencies.yaml, computes the task execution order, and runs independent tasks in parallel.
+         - If TASK_TYPE is "daemon", stays up and runs tasks received from the TASK_QUEUE_URL SQS queue.
          - Otherwise, executes a single specified task.
     3. Sends runtime log messages (e.g., warnings, errors) to a designated SQS queue.
     4. (Placeholder) Prepares for CloudWatch log integration.
@@ -27,46 +28,356 @@ Overview:
 
 import os
 import sys
+import atexit
+import signal
 import logging
+import threading
+import time
+import array
+import itertools
+import hashlib
+import pickle
+import stat
+import tempfile
 import boto3
+import botocore.config
 import yaml
 import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+from collections import deque
+
+
+class _CachingFormatter(logging.Formatter):
+    """
+    Formatter that formats each record once and reuses the result for every handler sharing it.
+    """
+    def format(self, record):
+        cached = getattr(record, "_msg_cache", None)
+        if cached is None:
+            cached = record._msg_cache = super().format(record)
+        return cached
+
+
+# Shared by the console and SQS handlers, so each record is only formatted once.
+_FMT = _CachingFormatter("%(asctime)s - %(levelname)s - %(message)s")
 
 # Configure basic logging.
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(_FMT)
+logging.basicConfig(level=logging.INFO, handlers=[_console_handler])
+logging.getLogger("botocore").setLevel(logging.WARNING)
+
+# Task modules are loaded from tasks/ in the working directory, like config.yaml.
+TASKS_ROOT = os.path.abspath("tasks")
+
+# Task modules already loaded in this process, by task name.
+_TASK_MODULES = {}
+
+# Shared SQS client, so the botocore session and service model are only built once.
+_SQS = boto3.session.Session().client(
+    "sqs",
+    region_name=os.environ.get("AWS_REGION", "us-east-2"),
+    config=botocore.config.Config(
+        max_pool_connections=32,
+        retries={"max_attempts": 3, "mode": "adaptive"},
+    ),
+)
 
 
 class SQSSenderHandler(logging.Handler):
     """
     Custom logging handler that sends log messages to an SQS queue.
+
+    Records are buffered and sent with send_message_batch by a background thread,
+    either as soon as a full batch is available or every `flush_interval` seconds,
+    whichever comes first. Logging never waits on SQS; when several batches are
+    pending they are sent concurrently.
     """
-    def __init__(self, queue_url):
+    # SQS accepts at most 10 entries per send_message_batch call.
+    BATCH_SIZE = 10
+    # Maximum number of send_message_batch calls in flight at once.
+    MAX_CONCURRENT_SENDS = 4
+    # At most this many batches are buffered; older records are dropped while SQS is unreachable.
+    MAX_BUFFERED_BATCHES = 100
+    # Records from the AWS SDK itself are never sent, since sending them would log more.
+    SDK_LOGGERS = ("boto3", "botocore", "urllib3")
+
+    def __init__(self, queue_url, flush_interval=0.2):
         super().__init__()
         self.queue_url = queue_url
-        self.sqs = boto3.client("sqs", region_name="us-east-2")
+        self.sqs = _SQS
+        self.flush_interval = flush_interval
+        self._buffer = deque()
+        self._buffer_lock = threading.Lock()
+        self._dropped = 0
+        self._flush_lock = threading.Lock()
+        self._seq = itertools.count()
+        self._local = threading.local()
+        self.addFilter(lambda record: not record.name.startswith(self.SDK_LOGGERS))
+        self._senders = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_SENDS)
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
 
     def emit(self, record):
+        # Drop records logged while this thread is already inside emit().
+        if getattr(self._local, "in_emit", False):
+            return
+        self._local.in_emit = True
         try:
             msg = self.format(record)
-            self.sqs.send_message(QueueUrl=self.queue_url, MessageBody=msg)
+            with self._buffer_lock:
+                self._append(msg)
+                full = len(self._buffer) >= self.BATCH_SIZE
+            if full:
+                self._wakeup.set()
         except Exception:
             self.handleError(record)
+        finally:
+            self._local.in_emit = False
+
+    def enqueue_terminal(self, msg):
+        """
+        Queue a completion signal behind the buffered log records and send it immediately.
+
+        Args:
+            msg (str): The completion signal (e.g., "DONE" or "ERROR").
+
+        Returns:
+            bool: True if every buffered entry, including the signal, was accepted by SQS.
+        """
+        # Hold the flush lock throughout, so the periodic flusher can't send the signal
+        # in between and leave this call to report on an empty buffer.
+        with self._flush_lock:
+            with self._buffer_lock:
+                self._append(msg)
+                entries = self._take_buffer()
+            return self._send_entries(entries)
+
+    def _append(self, msg):
+        """
+        Buffer a message, dropping the oldest one if the buffer is full. Must hold _buffer_lock.
+        """
+        if len(self._buffer) >= self.MAX_BUFFERED_BATCHES * self.BATCH_SIZE:
+            self._buffer.popleft()
+            self._dropped += 1
+        self._buffer.append({"Id": str(next(self._seq)), "MessageBody": msg})
+
+    def _flush_periodically(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._flush()
+
+    def _flush(self):
+        """
+        Send every buffered record to SQS, at most BATCH_SIZE entries per call.
+
+        Returns:
+            bool: True if SQS accepted every entry sent.
+        """
+        with self._flush_lock:
+            return self._flush_locked()
+
+    def _flush_locked(self):
+        """
+        Same as _flush(). Must hold _flush_lock.
+        """
+        with self._buffer_lock:
+            entries = self._take_buffer()
+        return self._send_entries(entries)
+
+    def _take_buffer(self):
+        """
+        Empty the buffer and return its entries, reporting any dropped records. Must hold _buffer_lock.
+        """
+        entries = list(self._buffer)
+        self._buffer.clear()
+        if self._dropped:
+            print(f"Dropped {self._dropped} log records because the SQS log buffer was full.", file=sys.stderr)
+            self._dropped = 0
+        return entries
+
+    def _send_entries(self, entries):
+        """
+        Send entries taken from the buffer. Must hold _flush_lock.
+
+        All batches but the last are sent concurrently; the last one, which holds any
+        completion signal, is only sent once they are done.
+
+        Returns:
+            bool: True if SQS accepted every entry sent.
+        """
+        if not entries:
+            return True
+        batches = [entries[i:i + self.BATCH_SIZE] for i in range(0, len(entries), self.BATCH_SIZE)]
+        futures = []
+        results = []
+        for i, batch in enumerate(batches[:-1]):
+            try:
+                futures.append(self._senders.submit(self._send_batch, batch))
+            except RuntimeError:
+                # The sender pool refuses new work once the interpreter is shutting down;
+                # send whatever wasn't submitted from this thread instead.
+                results = [self._send_batch(unsent) for unsent in batches[i:-1]]
+                break
+        results.extend(future.result() for future in futures)
+        results.append(self._send_batch(batches[-1]))
+        return all(results)
+
+    def _send_batch(self, entries):
+        try:
+            response = self.sqs.send_message_batch(QueueUrl=self.queue_url, Entries=entries)
+        except Exception as e:
+            # Logging from here would re-enter this handler, so report on stderr.
+            print(f"Failed to send log batch to SQS: {e}", file=sys.stderr)
+            return False
+        failed = response.get("Failed", [])
+        for failure in failed:
+            print(f"SQS rejected log entry {failure.get('Id')}: {failure.get('Message')}", file=sys.stderr)
+        return not failed
+
+    def flush(self):
+        self._flush()
+
+    def close(self):
+        self._stopped.set()
+        self._wakeup.set()
+        if self._flusher.is_alive() and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        self._flush()
+        self._senders.shutdown(wait=True)
+        super().close()
+
+
+# The SQS log handler attached by main(), if any.
+_sqs_handler = None
 
 
 def send_completion_signal(queue_url: str, msg: str):
     """
     Send a final completion signal to the SQS queue.
 
+    When the SQS log handler is attached, the signal is sent in the same batch as the
+    last buffered log records; otherwise it is sent on its own.
+
     Args:
         queue_url (str): The SQS queue URL.
         msg (str): The message to send (e.g., "DONE" or "ERROR").
     """
-    logging.info(f"Sending completion signal '{msg}' to SQS queue: {queue_url}")
+    logging.info("Sending completion signal '%s' to SQS queue: %s", msg, queue_url)
+    if _sqs_handler is not None and _sqs_handler.queue_url == queue_url:
+        if not _sqs_handler.enqueue_terminal(msg):
+            logging.error("Failed to send completion signal.")
+        return
+    try:
+        _SQS.send_message(QueueUrl=queue_url, MessageBody=msg)
+    except Exception as e:
+        logging.error("Failed to send completion signal: %s", e)
+
+
+def _load_yaml(path: str):
+    """
+    Parse a YAML file with the fastest available safe loader.
+
+    The file is opened in binary mode so LibYAML decodes it itself instead of
+    reading through Python's text layer.
+    """
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _yaml_cache_dir():
+    """
+    Return the private YAML cache directory, creating it if needed.
+
+    Returns:
+        str: The cache directory, or None if it can't be created or may have been
+            tampered with by another user.
+    """
+    cache_dir = os.path.join(tempfile.gettempdir(), f"yamlcache-{os.geteuid()}")
     try:
-        sqs = boto3.client("sqs", region_name="us-east-2")
-        sqs.send_message(QueueUrl=queue_url, MessageBody=msg)
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        st = os.lstat(cache_dir)
+    except OSError as e:
+        logging.warning("YAML cache disabled, cannot create %s: %s", cache_dir, e)
+        return None
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.geteuid() or st.st_mode & 0o077:
+        logging.warning("YAML cache disabled, %s is not a private directory owned by this user.", cache_dir)
+        return None
+    return cache_dir
+
+
+def parse_file(path: str):
+    """
+    Parse a YAML file, reusing a pickled copy of a previous parse when the file is unchanged.
+
+    Parsed data is cached under <tmpdir>/yamlcache-<uid>/, keyed by the file path, mtime and
+    size. The cache is only used if that directory is owned by the current user and not
+    accessible to anyone else, and older entries for the same file are removed on write.
+
+    Args:
+        path (str): Path to the YAML file.
+
+    Returns:
+        The parsed YAML document.
+    """
+    st = os.stat(path)
+    prefix = hashlib.sha256(os.path.abspath(path).encode()).hexdigest()
+    key = f"{prefix}-{st.st_mtime_ns}-{st.st_size}.pkl"
+    cache_dir = _yaml_cache_dir()
+    if cache_dir is None:
+        return _load_yaml(path)
+
+    cache_file = os.path.join(cache_dir, key)
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
     except Exception as e:
-        logging.error(f"Failed to send completion signal: {e}")
+        logging.warning("Ignoring unreadable YAML cache %s: %s", cache_file, e)
+
+    data = _load_yaml(path)
+
+    try:
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            pickle.dump(data, f, protocol=5)
+        os.replace(tmp_file, cache_file)
+        for name in os.listdir(cache_dir):
+            if name.startswith(f"{prefix}-") and name.endswith(".pkl") and name != key:
+                os.remove(os.path.join(cache_dir, name))
+    except OSError as e:
+        logging.warning("Failed to write YAML cache %s: %s", cache_file, e)
+    return data
+
+
+def load_task_config(path: str, key: str):
+    """
+    Look up a single top-level entry of a YAML configuration file.
+
+    The whole file is parsed through parse_file(), so warm runs are served from the
+    YAML cache and keys are matched exactly as yaml.safe_load would resolve them.
+
+    Args:
+        path (str): Path to the YAML file.
+        key (str): The top-level key to look up.
+
+    Returns:
+        The value stored under `key`, or None if the document has no such key.
+    """
+    config = parse_file(path)
+    if not isinstance(config, dict):
+        return None
+    return config.get(key)
 
 
 def execute_task(task_name: str) -> bool:
@@ -74,7 +385,8 @@ def execute_task(task_name: str) -> bool:
     Dynamically load and execute a task module.
 
     The task module should be located at tasks/<task_name>/<task_name>.py and must
-    define a `run()` function as its entry point.
+    define a `run()` function as its entry point. A module is only loaded once per
+    process; running the same task again reuses it.
 
     Args:
         task_name (str): The name of the task to execute.
@@ -82,30 +394,36 @@ def execute_task(task_name: str) -> bool:
     Returns:
         bool: True if the task executed successfully; False otherwise.
     """
-    task_file = os.path.join("tasks", task_name, f"{task_name}.py")
-    if not os.path.exists(task_file):
-        logging.error(f"Task file does not exist: {task_file}")
-        return False
-
+    task_file = f"{TASKS_ROOT}/{task_name}/{task_name}.py"
     try:
-        spec = importlib.util.spec_from_file_location(task_name, task_file)
-        task_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(task_module)
+        task_module = _TASK_MODULES.get(task_name)
+        if task_module is None:
+            spec = importlib.util.spec_from_file_location(task_name, task_file)
+            task_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(task_module)
+            _TASK_MODULES[task_name] = task_module
+    except FileNotFoundError as e:
+        # A missing file opened by the task's own module code is a load failure, not a missing task.
+        if e.filename != task_file:
+            logging.exception("Failed to load task module '%s': %s", task_name, e)
+        else:
+            logging.error("Task file does not exist: %s", task_file)
+        return False
     except Exception as e:
-        logging.exception(f"Failed to load task module '{task_name}': {e}")
+        logging.exception("Failed to load task module '%s': %s", task_name, e)
         return False
 
     if not hasattr(task_module, "run"):
-        logging.error(f"Task module '{task_name}' does not define a run() function.")
+        logging.error("Task module '%s' does not define a run() function.", task_name)
         return False
 
     try:
-        logging.info(f"Executing task '{task_name}'...")
+        logging.info("Executing task '%s'...", task_name)
         task_module.run()
-        logging.info(f"Task '{task_name}' executed successfully.")
+        logging.info("Task '%s' executed successfully.", task_name)
         return True
     except Exception as e:
-        logging.exception(f"An error occurred during execution of task '{task_name}': {e}")
+        logging.exception("An error occurred during execution of task '%s': %s", task_name, e)
         return False
 
 
@@ -113,57 +431,300 @@ def topological_sort(tasks, dependencies):
     """
     Compute a topological order of tasks given their dependencies.
 
+    Tasks are numbered once up front so the graph walk only does integer indexing.
+
     Args:
         tasks (set): A set of task names.
         dependencies (dict): A dictionary where key is a task and value is a list of tasks it depends on.
 
     Returns:
-        list: A list of tasks in execution order.
+        tuple: (order, names, successors, in_degree) where order is a list of tasks in execution
+            order (empty if no valid order exists), names maps task ids to task names, successors
+            lists the ids of the tasks depending on each task, and in_degree holds each task's
+            number of dependencies.
     """
-    from collections import defaultdict, deque
+    names = sorted(tasks)
+    name_to_id = {name: i for i, name in enumerate(names)}
+    n = len(names)
+    successors = [[] for _ in range(n)]
+    in_degree = array.array("i", [0] * n)
+
+    # Reject references to unknown tasks up front, so they aren't reported as a cycle.
+    unknown = {task for task in dependencies if task not in name_to_id}
+    unknown.update(dep for deps in dependencies.values() for dep in deps or () if dep not in name_to_id)
+    if unknown:
+        logging.error("Dependencies reference unknown tasks: %s", sorted(unknown))
+        return [], names, successors, in_degree
 
     # Build graph and in-degree count.
-    graph = defaultdict(list)
-    in_degree = {task: 0 for task in tasks}
     for task, deps in dependencies.items():
-        for dep in deps:
-            graph[dep].append(task)
-            in_degree[task] += 1
+        task_id = name_to_id[task]
+        for dep in deps or ():
+            successors[name_to_id[dep]].append(task_id)
+            in_degree[task_id] += 1
 
     # Find tasks with zero in-degree.
-    queue = deque([task for task in tasks if in_degree[task] == 0])
+    remaining = array.array("i", in_degree)
+    queue = deque(i for i in range(n) if remaining[i] == 0)
     order = []
 
     while queue:
         current = queue.popleft()
         order.append(current)
-        for neighbor in graph[current]:
-            in_degree[neighbor] -= 1
-            if in_degree[neighbor] == 0:
+        for neighbor in successors[current]:
+            remaining[neighbor] -= 1
+            if remaining[neighbor] == 0:
                 queue.append(neighbor)
 
-    if len(order) != len(tasks):
-        logging.error("Cycle detected or missing tasks in dependencies. Cannot compute a valid execution order.")
-        return []
+    if len(order) < n:
+        stuck = [names[i] for i in range(n) if remaining[i] > 0]
+        logging.error("Cycle detected in dependencies. Cycle or unresolved deps involve: %s", stuck)
+        return [], names, successors, in_degree
 
-    return order
+    return [names[i] for i in order], names, successors, in_degree
 
 
-def execute_task_sequence(task_order):
+def _init_task_worker(queue_url):
     """
-    Execute tasks in the provided order sequentially.
+    Initialize a task worker process so its log records are also sent to SQS.
+    """
+    sqs_handler = SQSSenderHandler(queue_url)
+    sqs_handler.setLevel(logging.INFO)
+    sqs_handler.setFormatter(_FMT)
+    logging.getLogger().addHandler(sqs_handler)
+
+
+def _run_task_in_worker(task_name: str) -> bool:
+    """
+    Execute a task inside a worker process and drain its buffered logs before returning.
+    """
+    try:
+        return execute_task(task_name)
+    finally:
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+
+
+def _new_task_pool(max_workers, queue_url):
+    """
+    Create a process pool for running tasks, with workers that send their logs to SQS.
+    """
+    # Workers are spawned rather than forked so they don't inherit the log flusher thread's state.
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_task_worker,
+        initargs=(queue_url,),
+    )
+
+
+def _task_succeeded(future, task_name: str) -> bool:
+    """
+    Report whether a task submitted to the process pool completed successfully.
+    """
+    try:
+        success = future.result()
+    except Exception as e:
+        logging.error("Worker process for task '%s' failed: %s", task_name, e)
+        success = False
+    return success
+
+
+def execute_task_graph(names, successors, in_degree, queue_url):
+    """
+    Execute tasks in dependency order, running tasks that do not depend on each other in parallel.
+
+    A task is submitted to a process pool as soon as all of its dependencies have completed.
 
     Args:
-        task_order (list): List of task names in the order they should be executed.
+        names (list): Task names, indexed by task id.
+        successors (list): For each task id, the ids of the tasks that depend on it.
+        in_degree (array): For each task id, its number of dependencies.
+        queue_url (str): The SQS queue URL worker processes send their logs to.
 
     Returns:
         bool: True if all tasks executed successfully, False otherwise.
     """
-    for task in task_order:
-        success = execute_task(task)
-        if not success:
-            logging.error(f"Execution halted. Task '{task}' failed.")
-            return False
+    remaining = array.array("i", in_degree)
+    executor = _new_task_pool(max(1, min(os.cpu_count() or 1, len(names))), queue_url)
+    try:
+        running = {
+            executor.submit(_run_task_in_worker, names[i]): i
+            for i in range(len(names)) if remaining[i] == 0
+        }
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            finished = {future: running.pop(future) for future in done}
+            # Check the whole batch before scheduling anything new, so a failure stops the run.
+            failed = [names[task_id] for future, task_id in finished.items() if not _task_succeeded(future, names[task_id])]
+            if failed:
+                for task in failed:
+                    logging.error("Execution halted. Task '%s' failed.", task)
+                executor.shutdown(wait=True, cancel_futures=True)
+                return False
+            for task_id in finished.values():
+                for neighbor in successors[task_id]:
+                    remaining[neighbor] -= 1
+                    if remaining[neighbor] == 0:
+                        running[executor.submit(_run_task_in_worker, names[neighbor])] = neighbor
+    finally:
+        executor.shutdown(wait=True)
+    return True
+
+
+# Daemon mode: how long a received task message stays hidden from other consumers, how
+# often that is extended while its task runs, and how many deliveries a task whose worker
+# process dies gets before its message is dropped.
+TASK_VISIBILITY_TIMEOUT = 60
+TASK_HEARTBEAT_INTERVAL = 20
+TASK_MAX_RECEIVES = 3
+
+
+def _task_message_batch(operation, task_queue_url, messages, **fields):
+    """
+    Apply an SQS batch operation (e.g. delete_message_batch) to task messages, 10 at a time.
+    """
+    for start in range(0, len(messages), 10):
+        entries = [
+            {"Id": str(i), "ReceiptHandle": message["ReceiptHandle"], **fields}
+            for i, message in enumerate(messages[start:start + 10])
+        ]
+        try:
+            response = getattr(_SQS, operation)(QueueUrl=task_queue_url, Entries=entries)
+        except Exception as e:
+            logging.error("SQS %s failed for task messages: %s", operation, e)
+            continue
+        for failure in response.get("Failed", []):
+            logging.error("SQS %s failed for a task message: %s", operation, failure.get("Message"))
+
+
+def _reap_daemon_tasks(task_queue_url, in_flight):
+    """
+    Handle finished daemon tasks and delete their messages.
+
+    A task whose worker process died keeps its message, so SQS delivers it again, until
+    it has been received TASK_MAX_RECEIVES times.
+
+    Args:
+        task_queue_url (str): The SQS queue URL task requests are received from.
+        in_flight (dict): Maps receipt handles to (future, task_name, message); finished
+            tasks are removed from it.
+    """
+    finished = []
+    for handle, (future, task_name, message) in list(in_flight.items()):
+        if not future.done():
+            continue
+        del in_flight[handle]
+        try:
+            success = future.result()
+        except Exception as e:
+            receives = int(message.get("Attributes", {}).get("ApproximateReceiveCount", 1))
+            if receives < TASK_MAX_RECEIVES:
+                logging.error("Worker process for task '%s' failed, it will be retried: %s", task_name, e)
+                continue
+            logging.error(
+                "Worker process for task '%s' failed on %d deliveries, dropping its message: %s",
+                task_name, receives, e,
+            )
+        else:
+            if not success:
+                logging.error("Task '%s' failed.", task_name)
+        finished.append(message)
+    _task_message_batch("delete_message_batch", task_queue_url, finished)
+
+
+def daemon_loop(queue_url, task_queue_url, config):
+    """
+    Run as a long-lived worker, executing tasks received from an SQS queue.
+
+    Each message body names a task type from config.yaml; the configured task is run in a
+    warm process pool, so worker processes keep their loaded task modules between tasks.
+    Messages are only received when a worker is free to run them, stay hidden from other
+    consumers while their task runs, and are deleted once it has finished, so unfinished
+    work stays on the queue. All SQS calls are made from this loop. The loop exits on
+    SIGTERM after the running tasks finish.
+
+    Args:
+        queue_url (str): The SQS queue URL worker processes send their logs to.
+        task_queue_url (str): The SQS queue URL task requests are received from.
+        config (dict): The task configuration loaded from config.yaml.
+
+    Returns:
+        bool: True once the loop has stopped.
+    """
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    max_workers = os.cpu_count() or 1
+    executor = _new_task_pool(max_workers, queue_url)
+    in_flight = {}
+    next_heartbeat = time.monotonic() + TASK_HEARTBEAT_INTERVAL
+
+    def tend():
+        """Reap finished tasks, and keep the messages of running ones hidden."""
+        nonlocal next_heartbeat
+        _reap_daemon_tasks(task_queue_url, in_flight)
+        if time.monotonic() >= next_heartbeat:
+            messages = [message for _, _, message in in_flight.values()]
+            _task_message_batch(
+                "change_message_visibility_batch", task_queue_url, messages,
+                VisibilityTimeout=TASK_VISIBILITY_TIMEOUT,
+            )
+            next_heartbeat = time.monotonic() + TASK_HEARTBEAT_INTERVAL
+
+    logging.info("Waiting for tasks on SQS queue: %s", task_queue_url)
+    try:
+        while not stop.is_set():
+            tend()
+            free = min(10, max_workers - len(in_flight))
+            if free <= 0:
+                wait([future for future, _, _ in in_flight.values()], timeout=1, return_when=FIRST_COMPLETED)
+                continue
+
+            # A short long-poll keeps SIGTERM handling well inside a typical stop grace period.
+            try:
+                messages = _SQS.receive_message(
+                    QueueUrl=task_queue_url,
+                    WaitTimeSeconds=5,
+                    MaxNumberOfMessages=free,
+                    VisibilityTimeout=TASK_VISIBILITY_TIMEOUT,
+                    AttributeNames=["ApproximateReceiveCount"],
+                ).get("Messages", [])
+            except Exception as e:
+                logging.error("Failed to receive task messages: %s", e)
+                stop.wait(1)
+                continue
+            if stop.is_set():
+                # Hand messages received while stopping straight back to the queue.
+                _task_message_batch("change_message_visibility_batch", task_queue_url, messages, VisibilityTimeout=0)
+                break
+
+            for message in messages:
+                task_type = message["Body"]
+                task_name = (config.get(task_type) or {}).get("task")
+                if not task_name:
+                    logging.error("No task configured for task type: %s", task_type)
+                    _task_message_batch("delete_message_batch", task_queue_url, [message])
+                    continue
+                future = None
+                try:
+                    future = executor.submit(_run_task_in_worker, task_name)
+                except BrokenProcessPool as e:
+                    logging.error("Task worker pool is broken, restarting it: %s", e)
+                    executor.shutdown(wait=False)
+                    executor = _new_task_pool(max_workers, queue_url)
+                    try:
+                        future = executor.submit(_run_task_in_worker, task_name)
+                    except Exception as e:
+                        logging.error("Failed to submit task '%s', leaving its message on the queue: %s", task_name, e)
+                if future is not None:
+                    in_flight[message["ReceiptHandle"]] = (future, task_name, message)
+
+        # Let running tasks finish, keeping their messages hidden meanwhile.
+        while in_flight:
+            wait([future for future, _, _ in in_flight.values()], timeout=1, return_when=FIRST_COMPLETED)
+            tend()
+    finally:
+        executor.shutdown(wait=True)
     return True
 
 
@@ -174,11 +735,16 @@ def main():
     Workflow:
         1. Loads configuration from config.yaml.
         2. Checks the TASK_TYPE environment variable:
-             - If TASK_TYPE is "all", loads dependencies.yaml, computes execution order, and runs tasks sequentially.
+             - If TASK_TYPE is "all", loads dependencies.yaml, computes execution order, and runs independent tasks in parallel.
+             - If TASK_TYPE is "daemon", keeps running tasks received from TASK_QUEUE_URL until stopped.
              - Otherwise, executes a single specified task.
         3. Sends a final completion signal to the SQS queue.
     """
+    global _sqs_handler
+
     logging.info("Slave process starting up...")
+    if SafeLoader is yaml.SafeLoader:
+        logging.warning("LibYAML is not available; falling back to the pure-Python YAML parser.")
 
     instance_id = os.environ.get("INSTANCE_ID", "unknown_instance")
     queue_url = os.environ.get("SQS_QUEUE_URL")
@@ -191,46 +757,58 @@ def main():
     # Attach the SQS log handler.
     sqs_handler = SQSSenderHandler(queue_url)
     sqs_handler.setLevel(logging.INFO)
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    sqs_handler.setFormatter(formatter)
+    sqs_handler.setFormatter(_FMT)
     logging.getLogger().addHandler(sqs_handler)
+    atexit.register(sqs_handler.close)
+    _sqs_handler = sqs_handler
 
     logging.info("CloudWatch logging integration: [Placeholder]")
 
-    # Load task configuration from config.yaml.
-    try:
-        with open("config.yaml", "r") as f:
-            config = yaml.safe_load(f)
-    except Exception as e:
-        logging.exception(f"Failed to load configuration: {e}")
-        send_completion_signal(queue_url, "ERROR")
-        sys.exit(1)
+    if task_type in ("all", "daemon"):
+        # Load task configuration from config.yaml.
+        try:
+            config = parse_file("config.yaml")
+        except Exception as e:
+            logging.exception("Failed to load configuration: %s", e)
+            send_completion_signal(queue_url, "ERROR")
+            sys.exit(1)
 
-    if task_type == "all":
+    if task_type == "daemon":
+        task_queue_url = os.environ.get("TASK_QUEUE_URL")
+        if not task_queue_url:
+            logging.error("TASK_QUEUE_URL environment variable is not set.")
+            send_completion_signal(queue_url, "ERROR")
+            sys.exit(1)
+        success = daemon_loop(queue_url, task_queue_url, config)
+    elif task_type == "all":
         # Load dependencies from dependencies.yaml.
         try:
-            with open("dependencies.yaml", "r") as f:
-                deps_config = yaml.safe_load(f)
+            deps_config = parse_file("dependencies.yaml")
             dependencies = deps_config.get("dependencies", {})
         except Exception as e:
-            logging.exception(f"Failed to load dependencies: {e}")
+            logging.exception("Failed to load dependencies: %s", e)
             send_completion_signal(queue_url, "ERROR")
             sys.exit(1)
 
         # Determine all tasks from configuration.
         all_tasks = set(config.keys())
-        task_order = topological_sort(all_tasks, dependencies)
+        task_order, names, successors, in_degree = topological_sort(all_tasks, dependencies)
         if not task_order:
             send_completion_signal(queue_url, "ERROR")
             sys.exit(1)
 
-        logging.info(f"Computed task execution order: {task_order}")
-        success = execute_task_sequence(task_order)
+        logging.info("Computed task execution order: %s", task_order)
+        success = execute_task_graph(names, successors, in_degree, queue_url)
     else:
         # Single task execution.
-        task_config = config.get(task_type)
+        try:
+            task_config = load_task_config("config.yaml", task_type)
+        except Exception as e:
+            logging.exception("Failed to load configuration: %s", e)
+            send_completion_signal(queue_url, "ERROR")
+            sys.exit(1)
         if not task_config:
-            logging.error(f"No configuration found for task type: {task_type}")
+            logging.error("No configuration found for task type: %s", task_type)
             send_completion_signal(queue_url, "ERROR")
             sys.exit(1)
         single_task = task_config.get("task")
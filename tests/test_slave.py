@@ -0,0 +1,198 @@
+import itertools
+import logging
+import os
+import tempfile
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+import slave
+
+
+class ParseFileTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        # Keep the YAML cache inside the test directory.
+        patcher = mock.patch("tempfile.tempdir", self.dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.path = os.path.join(self.dir, "config.yaml")
+        self.cache_dir = os.path.join(self.dir, f"yamlcache-{os.geteuid()}")
+
+    def write_config(self, text, mtime_ns):
+        with open(self.path, "w") as f:
+            f.write(text)
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_warm_parse_is_served_from_cache(self):
+        self.write_config("task1:\n  task: task1\n", 1_000_000_000)
+        self.assertEqual(slave.parse_file(self.path), {"task1": {"task": "task1"}})
+        with mock.patch.object(slave, "_load_yaml") as load:
+            self.assertEqual(slave.parse_file(self.path), {"task1": {"task": "task1"}})
+        load.assert_not_called()
+
+    def test_changed_file_is_parsed_again_and_old_entry_evicted(self):
+        self.write_config("task1:\n  task: task1\n", 1_000_000_000)
+        slave.parse_file(self.path)
+        self.write_config("task2:\n  task: task2\n", 2_000_000_000)
+        self.assertEqual(slave.parse_file(self.path), {"task2": {"task": "task2"}})
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_cache_created_private(self):
+        self.write_config("task1:\n  task: task1\n", 1_000_000_000)
+        slave.parse_file(self.path)
+        self.assertEqual(os.stat(self.cache_dir).st_mode & 0o777, 0o700)
+
+    def test_shared_cache_dir_is_not_used(self):
+        os.makedirs(self.cache_dir, mode=0o777)
+        os.chmod(self.cache_dir, 0o777)
+        self.write_config("task1:\n  task: task1\n", 1_000_000_000)
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(slave.parse_file(self.path), {"task1": {"task": "task1"}})
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+class SQSSenderHandlerTest(unittest.TestCase):
+    def make_handler(self):
+        handler = slave.SQSSenderHandler("queue-url", flush_interval=3600)
+        handler.sqs = mock.Mock()
+        handler.sqs.send_message_batch.return_value = {}
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self.addCleanup(handler.close)
+        return handler
+
+    def emit(self, handler, count):
+        for i in range(count):
+            handler.handle(logging.makeLogRecord({"name": "test", "msg": f"record {i}", "levelno": logging.INFO}))
+
+    def sent_batches(self, handler):
+        return [
+            [entry["MessageBody"] for entry in call.kwargs["Entries"]]
+            for call in handler.sqs.send_message_batch.call_args_list
+        ]
+
+    def test_terminal_signal_is_sent_last(self):
+        handler = self.make_handler()
+        self.emit(handler, 5)
+        self.assertTrue(handler.enqueue_terminal("DONE"))
+        batches = self.sent_batches(handler)
+        self.assertEqual(batches, [[f"record {i}" for i in range(5)] + ["DONE"]])
+
+    def test_terminal_signal_follows_earlier_batches(self):
+        handler = self.make_handler()
+        self.emit(handler, 25)
+        handler.enqueue_terminal("DONE")
+        batches = self.sent_batches(handler)
+        self.assertEqual(batches[-1][-1], "DONE")
+        self.assertEqual(sorted(sum(batches, [])), sorted([f"record {i}" for i in range(25)] + ["DONE"]))
+
+    def test_terminal_signal_reports_failed_send(self):
+        handler = self.make_handler()
+        handler.sqs.send_message_batch.side_effect = Exception("throttled")
+        with mock.patch("sys.stderr"):
+            self.assertFalse(handler.enqueue_terminal("ERROR"))
+
+    def test_terminal_signal_reports_rejected_entry(self):
+        handler = self.make_handler()
+        handler.sqs.send_message_batch.return_value = {"Failed": [{"Id": "0", "Message": "rejected"}]}
+        with mock.patch("sys.stderr"):
+            self.assertFalse(handler.enqueue_terminal("DONE"))
+
+    def test_full_buffer_drops_oldest_records(self):
+        handler = self.make_handler()
+        handler.MAX_BUFFERED_BATCHES = 2
+        # Hold the flush lock so nothing is sent while the buffer fills up.
+        with handler._flush_lock:
+            self.emit(handler, 25)
+            self.assertEqual(len(handler._buffer), 20)
+            self.assertEqual(handler._buffer[0]["MessageBody"], "record 5")
+        with mock.patch("sys.stderr") as stderr:
+            handler.enqueue_terminal("DONE")
+        # Queuing the signal into the full buffer drops one more old record, never the signal.
+        self.assertIn("Dropped 6 log records", "".join(c.args[0] for c in stderr.write.call_args_list))
+        batches = self.sent_batches(handler)
+        self.assertEqual(batches[-1][-1], "DONE")
+        self.assertEqual(sum(len(batch) for batch in batches), 20)
+
+    def test_batches_not_sent_twice_when_sender_pool_is_shut_down(self):
+        handler = self.make_handler()
+        with handler._flush_lock:
+            self.emit(handler, 35)
+        # The pool accepts the first batch, then refuses the rest as during interpreter shutdown.
+        submit = handler._senders.submit
+        calls = itertools.count()
+
+        def refuse_after_first(*args):
+            if next(calls):
+                raise RuntimeError("cannot schedule new futures after interpreter shutdown")
+            return submit(*args)
+
+        with mock.patch.object(handler._senders, "submit", side_effect=refuse_after_first):
+            handler._flush()
+        sent = sum(self.sent_batches(handler), [])
+        self.assertEqual(sorted(sent), sorted(f"record {i}" for i in range(35)))
+        self.assertEqual(handler.sqs.send_message_batch.call_count, 4)
+
+
+class TopologicalSortTest(unittest.TestCase):
+    def test_orders_dependencies_first(self):
+        order, names, successors, in_degree = slave.topological_sort(
+            {"a", "b", "c"}, {"c": ["b"], "b": ["a"]},
+        )
+        self.assertEqual(order, ["a", "b", "c"])
+        self.assertEqual(list(in_degree), [0, 1, 1])
+        self.assertEqual(successors[names.index("a")], [names.index("b")])
+
+    def test_null_dependency_list_is_allowed(self):
+        order, _, _, _ = slave.topological_sort({"a", "b"}, {"b": None})
+        self.assertEqual(sorted(order), ["a", "b"])
+
+    def test_unknown_tasks_are_reported(self):
+        with self.assertLogs(level="ERROR") as logs:
+            order, _, _, _ = slave.topological_sort({"a", "b"}, {"b": ["x"], "z": ["a"]})
+        self.assertEqual(order, [])
+        self.assertIn("unknown tasks: ['x', 'z']", logs.output[0])
+
+    def test_cycle_members_are_reported(self):
+        with self.assertLogs(level="ERROR") as logs:
+            order, _, _, _ = slave.topological_sort(
+                {"a", "b", "c", "d"}, {"b": ["a"], "c": ["d"], "d": ["c"]},
+            )
+        self.assertEqual(order, [])
+        self.assertIn("['c', 'd']", logs.output[0])
+        self.assertNotIn("'a'", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class ReapDaemonTasksTest(unittest.TestCase):
+    def reap(self, future, receives):
+        message = {"ReceiptHandle": "h", "Attributes": {"ApproximateReceiveCount": str(receives)}}
+        in_flight = {"h": (future, "task", message)}
+        with mock.patch.object(slave, "_SQS") as sqs, self.assertLogs(level="ERROR"):
+            sqs.delete_message_batch.return_value = {"Failed": []}
+            slave._reap_daemon_tasks("queue", in_flight)
+        self.assertEqual(in_flight, {})
+        return sqs.delete_message_batch
+
+    def crashed(self):
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+    def test_finished_task_message_is_deleted(self):
+        future = Future()
+        future.set_result(False)
+        delete = self.reap(future, 1)
+        self.assertEqual(delete.call_args.kwargs["Entries"][0]["ReceiptHandle"], "h")
+
+    def test_crashed_task_message_is_kept_for_redelivery(self):
+        self.reap(self.crashed(), slave.TASK_MAX_RECEIVES - 1).assert_not_called()
+
+    def test_crashed_task_message_is_dropped_after_max_receives(self):
+        self.reap(self.crashed(), slave.TASK_MAX_RECEIVES).assert_called_once()